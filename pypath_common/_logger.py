@@ -155,7 +155,7 @@ class Logger:
 
         # sending some greetings
         self.msg('Welcome!')
-        self.msg('Logger started, logging into `%s`.' % self.fname)
+        self.msg('Logger started, logging into `%s`.', args = (self.fname,))
 
     def msg(
         self,
@@ -163,6 +163,8 @@ class Logger:
         label: Optional[str] = None,
         level: int = 0,
         wrap: bool = True,
+        *,
+        args: tuple = (),
     ):
         """
         Writes a message into the log file.
@@ -179,19 +181,45 @@ class Logger:
                 dropped.
             wrap:
                 Wrap long messages to multiple lines.
+            args:
+                Values to be interpolated into the message by the ``%``
+                operator. The interpolation happens only if the message is
+                written to the log file or to the console.
         """
 
-        if level <= self.verbosity:
+        to_file = level <= self.verbosity
+        to_console = level <= self.console_level
+
+        if args and (to_file or to_console):
+
+            msg = msg % args
+
+        if to_file:
 
             msg = self.label_message(msg, label = label)
             msg = self.wrapper.fill(msg) if wrap else msg
             msg = self.timestamp_message(msg)
             self.fp.write(msg.encode('utf8', errors = 'replace'))
 
-        if level <= self.console_level:
+        if to_console:
 
             self._console(msg)
 
+    def enabled(self, level: int = 0) -> bool:
+        """
+        Tells if messages of a certain level would be written anywhere.
+
+        Args:
+            level:
+                The loglevel.
+
+        Returns:
+            True if messages at this level are written either into the log
+            file or to the console.
+        """
+
+        return level <= self.verbosity or level <= self.console_level
+
     def label_message(self, msg, label = None):
         """
         Adds a label in front of the message.
@@ -213,7 +241,13 @@ class Logger:
         sys.stdout.write(msg)
         sys.stdout.flush()
 
-    def console(self, msg: str = '', label: Optional[str] = None):
+    def console(
+        self,
+        msg: str = '',
+        label: Optional[str] = None,
+        *,
+        args: tuple = (),
+    ):
         """
         Prints a message to the console and also to the logfile.
 
@@ -224,9 +258,11 @@ class Logger:
                 A label to be placed before the message in square brackets.
                 Typically it points to the code unit emitting the log message,
                 e.g. the module or class.
+            args:
+                Values to be interpolated into the message.
         """
 
-        self.msg(msg = msg, label = label, level = self.console_level)
+        self.msg(msg, label = label, level = self.console_level, args = args)
 
     @classmethod
     def timestamp(cls):
@@ -243,8 +279,14 @@ class Logger:
         Especially, shut down the flushing thread and close the logfile.
         """
 
-        self.msg('Logger shut down, logfile `%s` closed.' % self.fname)
-        self.msg('Bye.')
+        if hasattr(self, 'fp') and not self.fp.closed:
+
+            self.msg(
+                'Logger shut down, logfile `%s` closed.',
+                args = (self.fname,),
+            )
+            self.msg('Bye.')
+
         self.close_logfile()
 
     def get_logdir(self, dirname = None):
@@ -273,7 +315,10 @@ class Logger:
 
         self.close_logfile()
 
-        self.fp = open(self.fname, 'wb')
+        # messages are collected in this buffer and written to the disk
+        # when it is full or by the periodic flush
+        buffer_size = self.settings.get('log_buffer_size') or -1
+        self.fp = open(self.fname, 'wb', buffering = buffer_size)
 
     def close_logfile(self):
         """
@@ -42,6 +42,7 @@ import importlib
 import itertools
 import collections
 
+import yaml
 import psutil
 import tabulate
 
@@ -171,38 +172,73 @@ __all__ = [
     'upper0',
     'values',
     'wrap_truncate',
+    'yaml_load',
 ]
 
 
-def aacodes() -> dict[str, str]:
+@functools.lru_cache(maxsize = None)
+def _module_data(name: str) -> Any:
+    """
+    Load a built-in dataset of this module, only at the first access.
+
+    The same object is shared by all callers, hence it is frozen: dicts are
+    returned as read-only views, lists as tuples and sets as frozensets, at
+    any depth.
+    """
+
+    return _freeze(_data.load(name, module = 'pypath_common'))
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Immutable version of nested dicts, lists, tuples and sets.
+    """
+
+    if isinstance(obj, dict):
+
+        return types.MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+
+    elif isinstance(obj, (list, tuple)):
+
+        return tuple(_freeze(i) for i in obj)
+
+    elif isinstance(obj, set):
+
+        return frozenset(_freeze(i) for i in obj)
+
+    return obj
+
+
+def aacodes() -> Mapping[str, str]:
     """
     Mapping between single letter and three letters amino acid codes.
     """
 
-    return _data.module_data('aacodes')
+    return _module_data('aacodes')
 
 
-def aanames() -> dict[str, str]:
+def aanames() -> Mapping[str, str]:
     """
     Mapping between common names and single letter codes of amino acids.
     """
 
-    return _data.module_data('aanames')
+    return _module_data('aanames')
 
 
-def mod_keywords() -> dict[str, list]:
+def mod_keywords() -> Mapping[str, tuple]:
     """
     Resource specific post-translational modification name patterns.
     """
 
-    return _data.module_data('mod_keywords')
+    return _module_data('mod_keywords')
 
 
-def aaletters() -> dict[str, str]:
+@functools.lru_cache(maxsize = None)
+def aaletters() -> Mapping[str, str]:
     """
     Mapping between three letters and single letter amino acid codes.
     """
-    return swap_dict(aacodes())
+    return types.MappingProxyType(swap_dict(aacodes()))
 
 
 refloat = re.compile(r'^\s*-?\s*[\s\.\d]+\s*$')
@@ -890,12 +926,12 @@ def md5(value: Any) -> str:
     return hashlib.md5(value).hexdigest()
 
 
-def igraph_graphics_attrs() -> dict[str, list]:
+def igraph_graphics_attrs() -> Mapping[str, tuple]:
     """
     Igraph graphics parameters for edges and vertices.
     """
 
-    return _data.module_data('igraph_graphics_attrs')
+    return _module_data('igraph_graphics_attrs')
 
 
 def merge_dicts(d1: dict, d2: dict) -> dict:
@@ -1213,20 +1249,20 @@ def join_dicts(d1, d2, _from = 'keys', to = 'values'):  # TODO
     return result
 
 
-def psite_mod_types() -> list[tuple[str, str]]:
+def psite_mod_types() -> tuple[tuple[str, str], ...]:
     """
     PhosphoSite PTM type codes.
     """  # noqa: D403
 
-    return _data.module_data('psite_mod_types')
+    return _module_data('psite_mod_types')
 
 
-def psite_mod_types2() -> list[tuple[str, str]]:
+def psite_mod_types2() -> tuple[tuple[str, str], ...]:
     """
     PhosphoSite PTM type codes, version 2.
     """  # noqa: D403
 
-    return _data.module_data('psite_mod_types2')
+    return _module_data('psite_mod_types2')
 
 
 def pmod_bel() -> tuple[tuple[str, tuple[str]]]:
@@ -1234,26 +1270,28 @@ def pmod_bel() -> tuple[tuple[str, tuple[str]]]:
     BEL (Biological Expression Language) PTM type codes and keywords.
     """
 
-    return _data.module_data('pmod_bel')
+    return _module_data('pmod_bel')
 
 
-def pmod_bel_to_other() -> dict[str, tuple[str]]:
+@functools.lru_cache(maxsize = None)
+def pmod_bel_to_other() -> Mapping[str, tuple[str]]:
     """
     BEL (Biological Expression Language) PTM type codes and keywords.
     """
 
-    return dict(pmod_bel())
+    return types.MappingProxyType(dict(pmod_bel()))
 
 
-def pmod_other_to_bel() -> dict[str, str]:
+@functools.lru_cache(maxsize = None)
+def pmod_other_to_bel() -> Mapping[str, str]:
     """
     BEL (Biological Expression Language) PTM type codes and keywords.
     """
 
-    return {
+    return types.MappingProxyType({
         other_name: bel_name
         for bel_name, other_names in pmod_bel() for other_name in other_names
-    }
+    })
 
 
 def amino_acids() -> tuple[tuple[str]]:
@@ -1261,23 +1299,29 @@ def amino_acids() -> tuple[tuple[str]]:
     Amino acid names, three letters and single letter codes.
     """
 
-    return _data.module_data('amino_acids')
+    return _module_data('amino_acids')
 
 
-def aminoa_3_to_1_letter() -> dict[str, str]:
+@functools.lru_cache(maxsize = None)
+def aminoa_3_to_1_letter() -> Mapping[str, str]:
     """
     Mapping from amino acid 3 letters to single letter codes.
     """
 
-    return {code3: code1 for name, code3, code1 in amino_acids()}
+    _, codes3, codes1 = zip(*amino_acids())
 
+    return types.MappingProxyType(dict(zip(codes3, codes1)))
 
-def aminoa_1_to_3_letter() -> dict[str, str]:
+
+@functools.lru_cache(maxsize = None)
+def aminoa_1_to_3_letter() -> Mapping[str, str]:
     """
     Mapping from amino acid single letter to 3 letters codes.
     """
 
-    return {code1: code3 for name, code3, code1 in amino_acids()}
+    _, codes3, codes1 = zip(*amino_acids())
+
+    return types.MappingProxyType(dict(zip(codes1, codes3)))
 
 
 def paginate(lst: Collection, size: int = 10) -> list[list]:
@@ -2136,6 +2180,11 @@ def add_method(cls, method_name, method, signature = None, doc = None):
     setattr(cls, method_name, method)
 
 
+_CALLER_FORBIDDEN = frozenset(
+    ('importlib', 'console', '__main__', 'code', 'IPython'),
+)
+
+
 def caller_module(with_submodules: bool = False) -> str:
     """
     Name of the module indirectly calling this function.
@@ -2145,35 +2194,33 @@ def caller_module(with_submodules: bool = False) -> str:
 
     Args:
         with_submodules:
-            Include submodules, or return only the name of the top level
-            module.
+            Deprecated, has no effect: always the name of the top level
+            module is returned. Kept for backwards compatibility.
 
     Returns:
-        The name of the module calling this function.
+        The name of the top level module calling this function.
     """
 
-    forbidden = {'importlib', 'console', '__main__', 'code', 'IPython'}
-
-    mod_top = lambda mod: mod.split('.')[0]
-    mod_of_fi = lambda fi: mod_top(fi.frame.f_globals['__name__'])
+    this_module = __name__.partition('.')[0]
+    # walking the frames directly is much cheaper than `inspect.stack()`,
+    # which also reads the source lines of each frame
+    frame = sys._getframe(1)
 
-    stack = inspect.stack()
-    this_module = mod_top(mod_of_fi(stack[0]))
+    while frame is not None:
 
-    for fi in stack:
-
-        mod_full = mod_of_fi(fi)
-        mod = mod_top(mod_full)
+        mod = frame.f_globals.get('__name__', '').partition('.')[0]
 
         if mod != this_module:
 
-            if mod in forbidden:
+            if mod in _CALLER_FORBIDDEN:
 
                 break
 
             else:
 
-                return mod_full if with_submodules else mod
+                return mod
+
+        frame = frame.f_back
 
     return this_module
 
@@ -2190,9 +2237,11 @@ def module_path(module: str, directory: bool = True) -> pl.Path | None:
 
     Returns:
         Path to the module file or the directory containing the module.
+        None if the module does not exist, or has no single location, as
+        namespace packages.
     """
 
-    if spec := importlib.util.find_spec(module):
+    if (spec := importlib.util.find_spec(module)) and spec.origin:
 
         path = pl.Path(spec.origin)
 
@@ -3019,3 +3068,36 @@ def ext(path: str) -> str:
     ex = ex.lstrip('.')
 
     return ex
+
+
+class _YamlLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+    """
+    Safe YAML loader with support for tuples.
+
+    Based on the libyaml bindings if those are available.
+    """
+
+
+_YamlLoader.add_constructor(
+    'tag:yaml.org,2002:python/tuple',
+    lambda loader, node: tuple(loader.construct_sequence(node)),
+)
+
+
+def yaml_load(stream: Any) -> Any:
+    """
+    Parse a YAML document.
+
+    Only standard YAML tags are supported, with the exception of
+    ``!!python/tuple``, which is used in the data files of this module.
+
+    Args:
+        stream:
+            A string or a file object (text or binary) with the YAML
+            contents.
+
+    Returns:
+        The object parsed from the YAML document.
+    """
+
+    return yaml.load(stream, Loader = _YamlLoader)
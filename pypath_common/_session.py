@@ -25,7 +25,6 @@ from typing import Union, Optional
 import os
 import sys
 import builtins
-import itertools
 import traceback
 
 from pypath_common import _misc, _logger, _settings
@@ -51,6 +50,20 @@ class Session:
     Session manager.
     """
 
+    __slots__ = (
+        'module',
+        'module_root',
+        'label',
+        'logdir',
+        'config',
+        'log_verbosity',
+        'logfile',
+        '_logger',
+        '_managed_loggers',
+        '_finished',
+        '__weakref__',
+    )
+
     def __init__(
         self,
         module: Optional[str] = None,
@@ -96,15 +109,24 @@ class Session:
             _dict = config_dict,
             **kwargs
         )
-        self.log_verbosity = _misc.first_value(
-            log_verbosity,
-            self.config.get('log_verbosity'),
+        self.log_verbosity = (
+            log_verbosity
+            if log_verbosity is not None
+            else self.config.get('log_verbosity')
         )
 
         self.start_logger()
-        self._logger.msg('Session `%s` started.' % self.label)
-        self._logger.msg('Config has been read from the following files:')
-        [self._logger.msg(f'  - {path}') for path in self.config._parsed]
+        self._logger.msg('Session `%s` started.', args = (self.label,))
+
+        if self.config._parsed and self._logger.enabled():
+
+            self._logger.msg(
+                'Config has been read from the following files:\n%s',
+                wrap = False,
+                args = (
+                    '\n'.join(f'  - {path}' for path in self.config._parsed),
+                ),
+            )
 
 
     @staticmethod
@@ -133,7 +155,7 @@ class Session:
         env_var = f'{self.module.upper()}_LOG'
 
         self.logfile = str(
-            os.getenv(env_var) or
+            os.environ.get(env_var) or
             getattr(builtins, env_var, None) or
             f'{self.module}-{self.label}.log',
         )
@@ -146,6 +168,7 @@ class Session:
             logdir = logdir,
         )
         self._managed_loggers = {}
+        self._finished = False
 
 
     def finish_logger(self):
@@ -153,8 +176,9 @@ class Session:
         Close the logger.
         """
 
-        self._logger.msg('Session `%s` finished.' % self.label)
+        self._logger.msg('Session `%s` finished.', args = (self.label,))
         self._logger.close_logfile()
+        self._finished = True
 
 
     def __repr__(self):
@@ -164,9 +188,19 @@ class Session:
 
     def __del__(self):
 
-        if hasattr(self, '_logger'):
+        if not getattr(self, '_finished', True):
+
+            # at interpreter shutdown the logger might be already torn down
+            try:
 
-            self._logger.msg('Session `%s` finished.' % self.label)
+                self._logger.msg(
+                    'Session `%s` finished.',
+                    args = (self.label,),
+                )
+
+            except Exception:  # noqa: S110
+
+                pass
 
 
     def get(self, param, override = None):
@@ -232,11 +266,14 @@ class Session:
 
         name = name or self.module
 
-        if name not in self._managed_loggers:
+        if (managed := self._managed_loggers.get(name)) is None:
 
-            self._managed_loggers[name] = ManagedLogger(name = name)
+            managed = self._managed_loggers[name] = ManagedLogger(
+                name = name,
+                module = self.module,
+            )
 
-        return self._managed_loggers[name]
+        return managed
 
 
     def log(self, msg: str = '', level: int = 0, name: str | None = None):
@@ -276,22 +313,32 @@ class Logger:
 
         self._log_name = name or self.__class__.__name__
         self._logger = session_logger(module = module)
+        self._log_write = self._logger.msg
+        self._log_console = self._logger.console
 
 
-    def _log(self, msg = '', level = 0):
+    def _log(self, msg = '', level = 0, *, args = ()):
         """
         Write a message into the logfile.
+
+        The values in `args` are interpolated into the message only if the
+        message is actually written.
         """
 
-        self._logger.msg(msg = msg, label = self._log_name, level = level)
+        self._log_write(
+            msg,
+            label = self._log_name,
+            level = level,
+            args = args,
+        )
 
 
-    def _console(self, msg = ''):
+    def _console(self, msg = '', *, args = ()):
         """
         Write a message to the console and also to the logfile.
         """
 
-        self._logger.console(msg = msg, label = self._log_name)
+        self._log_console(msg, label = self._log_name, args = args)
 
 
     def _log_traceback(self, console: bool = False):
@@ -299,43 +346,45 @@ class Logger:
         Include a traceback into the log.
         """
 
+        if not console and not self._logger.enabled():
+
+            return
+
         exc_type, exc_value, exc_traceback = sys.exc_info()
 
         if exc_type is not None:
 
             f = exc_traceback.tb_frame.f_back
             stack = traceback.extract_stack(f)
+            # frames between the handler and the point of raising
+            stack.extend(traceback.extract_tb(exc_traceback))
 
         else:
 
             stack = traceback.extract_stack()[:-1]
 
         trc = 'Traceback (most recent call last):\n'
-        trc_list = list(
-            itertools.chain(
-                *(
-                    stack_level.strip('\n').split('\n')
-                    for stack_level in traceback.format_list(stack)
-                )
+        # the last module level frame, searched from the end of the stack
+        stack_top = next(
+            (
+                i
+                for i in range(len(stack) - 1, -1, -1)
+                if stack[i].name == '<module>'
             ),
+            0,
         )
+        trc_list = ''.join(
+            traceback.format_list(stack[stack_top:]),
+        ).splitlines()
 
         if exc_type is not None:
 
             trc_list.extend(
-                ('  %s' % traceback.format_exc().lstrip(trc)).split('\n'),
+                ''.join(
+                    traceback.format_exception_only(exc_type, exc_value),
+                ).splitlines(),
             )
 
-        stack_top = 0
-
-        for i, line in enumerate(trc_list):
-
-            if line.strip().endswith('<module>'):
-
-                stack_top = i
-
-        trc_list = trc_list[stack_top:]
-
         write = self._console if console else self._log
 
         write(trc.strip())
@@ -367,13 +416,14 @@ def _get_module(
             Override the name of the module instead of getting it from
             some parent frame.
         top:
-            Return only the top level module, without submodules.
+            Deprecated, has no effect: the name of the top level module is
+            always returned.
 
     Returns:
         The name of the module of the caller ``level`` frames above.
     """
 
-    module = module or _misc.caller_module(with_submodules = not top)
+    module = module or _misc.caller_module()
 
     if module == 'pypath_common':
 
@@ -396,13 +446,15 @@ def session(module: Optional[str] = None, **kwargs) -> Session:
         The session of the module.
     """
 
-    module = _get_module(module, top = True)
+    # module names given are only canonicalized, the stack is not inspected
+    module = _get_module(module)
 
-    if module not in SESSIONS:
+    if (sess := SESSIONS.get(module)) is None:
 
         new_session(module = module, **kwargs)
+        sess = SESSIONS[module]
 
-    return SESSIONS[module]
+    return sess
 
 
 def session_logger(module: Optional[str] = None) -> _logger.Logger:
@@ -26,24 +26,33 @@ A simple settings (config) manager.
 from __future__ import annotations
 
 from types import MappingProxyType
-from typing import Any, Iterable
+from typing import Any, Mapping, Iterable
 import os
 import re
+import sys
+import copy
 import pathlib as pl
+import functools
 import itertools
 import contextlib
+import collections
 
-import yaml
 import platformdirs
 
 import pypath_common._misc as _misc
 
 __all__ = ['Settings']
 
+_MODNAME_RE = re.compile(r'[\w.]+')
+
 
 class Settings:
     """
     Manage settings for other modules.
+
+    The module and author are not supposed to change after the instance has
+    been created: the config file names and directories derived from them are
+    computed only once.
     """
 
     _EXTENSIONS = ('yaml', 'yml')
@@ -78,17 +87,22 @@ class Settings:
         self.author = author
         self._custom_paths()
         self._read_defaults()
-        self.reset_all()
+        self._reset()
         self.setup(_dict, **kwargs)
 
 
     def _bootstrap(self):
 
         self._parsed = []
+        # lowest priority first; `paths_in` returns only existing files
+        paths = itertools.chain(
+            reversed(self.paths_in()),
+            (p for p in reversed(self._paths) if os.path.exists(p)),
+        )
 
-        for path in reversed(self.paths):
+        for path in paths:
 
-            if os.path.exists(path) and path not in self._parsed:
+            if path not in self._parsed:
 
                 self._parsed.append(path)
                 self.setup(self.read(path))
@@ -113,14 +127,12 @@ class Settings:
 
         if path and os.path.exists(path):
 
-            with open(path) as fp:
-
-                config = yaml.load(fp, Loader = yaml.FullLoader)
+            config = copy.deepcopy(_read_yaml(os.fspath(path), _stamp(path)))
 
         return config
 
 
-    @property
+    @functools.cached_property
     def _module_basedir(self) -> pl.Path | None:
 
         if self.module:
@@ -128,7 +140,7 @@ class Settings:
             return _misc.module_path(self.module)
 
 
-    @property
+    @functools.cached_property
     def _module_datadir(self) -> str | None:
 
         mod_dir = self._module_basedir
@@ -138,25 +150,25 @@ class Settings:
             return os.path.join(mod_dir, 'data')
 
 
-    @property
+    @functools.cached_property
     def _user_config_dir(self) -> str | None:
 
         return platformdirs.user_config_dir(self.module, self.author)
 
 
-    @property
+    @functools.cached_property
     def _user_cache_dir(self) -> str | None:
 
         return platformdirs.user_cache_dir(self.module, self.author)
 
 
-    @property
+    @functools.cached_property
     def _user_secrets_dir(self) -> str | None:
 
         return os.path.join(self._user_config_dir, 'secrets')
 
 
-    @property
+    @functools.cached_property
     def _old_user_config_dir(self) -> str | None:
 
         return os.path.join(os.path.expanduser('~'), f'.{self.module}')
@@ -172,15 +184,24 @@ class Settings:
         element tuple is returned.
         """
 
+        return (os.getcwd(),) + self._config_dirs
+
+
+    @functools.cached_property
+    def _config_dirs(self) -> tuple[str]:
+        """
+        The config directories which don't change during the lifetime of
+        the instance: all in `_directories` except the working directory.
+        """
+
         return (
-            os.getcwd(),
             self._user_config_dir,
             self._old_user_config_dir,
             self._module_datadir,
         )
 
 
-    @property
+    @functools.cached_property
     def _fname_stems(self) -> list[str]:
 
         with_modname = [
@@ -192,7 +213,7 @@ class Settings:
         return list(self._NAME_STEMS) + with_modname
 
 
-    @property
+    @functools.cached_property
     def _fnames(self) -> list[str]:
 
         return [
@@ -210,7 +231,7 @@ class Settings:
             builtin = True,
     ) -> list[pl.Path]:
         """
-        All possible config paths from the requested directories.
+        Existing config files in the requested directories.
 
         Args:
             wd:
@@ -224,8 +245,8 @@ class Settings:
                 Include paths in the module's built in directory.
 
         Returns:
-            A list of paths covering all possible directories, file names and
-            extensions.
+            A list of paths to the files in these directories which match any
+            of the possible config file names and extensions.
         """
 
         directories = (
@@ -238,13 +259,23 @@ class Settings:
                 if e
             ]
         )
+        # each directory only once, at its last, lowest priority position:
+        # that is where its files used to be parsed
+        directories = reversed(
+            dict.fromkeys(
+                os.fspath(d) for d in reversed(directories) if d
+            ),
+        )
 
-        return [
-            pl.Path(d) / f
-            for d in directories
-            for f in self._fnames
-            if d
-        ]
+        paths = []
+
+        for d in directories:
+
+            # one directory listing instead of testing each possible file name
+            names = _dir_contents(d)
+            paths.extend(pl.Path(d, f) for f in self._fnames if f in names)
+
+        return paths
 
 
     def _custom_paths(self):
@@ -254,16 +285,9 @@ class Settings:
 
         for path in self._paths:
 
-            if not os.path.isfile(path) and re.match(r'[\w\.]+', str(path)):
+            if not os.path.isfile(path) and _MODNAME_RE.fullmatch(str(path)):
 
-                mod_path = _misc.module_path(str(path))
-                modules.append(mod_path)
-
-                for datadir in ('data', '_data'):
-
-                    if (mod_data_path := mod_path / datadir).exists():
-
-                        modules.append(mod_data_path)
+                modules.extend(_module_config_dirs(str(path)))
 
             else:
 
@@ -276,7 +300,7 @@ class Settings:
     @property
     def paths(self) -> list[pl.Path]:
         """
-        All possible config paths.
+        Config paths: the ones provided by the user and the existing ones.
         """
 
         return self._paths + self.paths_in()
@@ -284,26 +308,36 @@ class Settings:
 
     def _read_defaults(self):
 
-        result = {}
         datadirs = _misc.to_list(self._module_datadir) + self._other_modules
 
-        for datadir, fname in itertools.product(datadirs, self._fnames):
-
-            if module_fname := os.path.join(datadir, fname):
-
-                result = self.read(module_fname)
-                break
-
-        self._module_defaults = result
+        self._module_defaults = _builtin_defaults(
+            tuple(os.fspath(d) for d in datadirs),
+            tuple(self._fnames),
+        )
 
 
     def reset_all(self):
         """
         Set the values of all parameters to their defaults.
+
+        The config files, including the built-in defaults, are listed and
+        read again, even if they changed without their modification time
+        changing.
         """
 
+        _listdir.cache_clear()
+        _read_yaml.cache_clear()
+        _builtin_defaults.cache_clear()
+        self._read_defaults()
+        self._reset()
+
+
+    def _reset(self):
+
         self._settings = {}
         self._context_settings = []
+        # the current values: settings overridden by the active contexts
+        self._effective = {}
         self._bootstrap()
 
 
@@ -333,7 +367,7 @@ class Settings:
 
     def _finish_defaults(self):
 
-        self._defaults = MappingProxyType(self.as_dict)
+        self._defaults = MappingProxyType(self._settings.copy())
 
 
     def _setup_cachedir(self):
@@ -382,17 +416,38 @@ class Settings:
             None
         """
 
-        _dict = self._dict_and_kwargs(_dict, kwargs)
+        _dict = self._interned(self._dict_and_kwargs(_dict, kwargs))
         self._settings.update(_dict)
 
+        if self._context_settings:
+
+            _dict = {
+                k: v for k, v in _dict.items()
+                if not any(k in ctx for ctx in self._context_settings)
+            }
+
+        self._effective.update(_dict)
+
 
     @staticmethod
-    def _dict_and_kwargs(_dict, kwargs):
+    def _dict_and_kwargs(_dict, kwargs) -> collections.ChainMap:
+        """
+        Merge the parameters without copying or modifying the dict provided.
+        """
+
+        return collections.ChainMap(kwargs, _dict or {})
 
-        _dict = _dict or {}
-        _dict.update(kwargs)
 
-        return _dict
+    @staticmethod
+    def _interned(params: Mapping) -> dict:
+        """
+        Copy of the parameters with interned keys, for faster lookups.
+        """
+
+        return {
+            sys.intern(k) if isinstance(k, str) else k: v
+            for k, v in params.items()
+        }
 
 
     def get(self, param, override = None, default = None):
@@ -410,11 +465,13 @@ class Settings:
             settings, this default value will be returned instead.
         """
 
-        return (
-            (default if self[param] is None else self[param])
-            if override is None
-            else override
-        )
+        if override is not None:
+
+            return override
+
+        value = self._effective.get(param)
+
+        return default if value is None else value
 
 
     def default(self, param: str) -> Any:
@@ -444,7 +501,8 @@ class Settings:
             The default value of the parameter or None.
         """
 
-        return self._module_defaults.get(param, None)
+        # the defaults are shared by all instances, callers get a copy
+        return copy.deepcopy(self._module_defaults.get(param, None))
 
 
     @property
@@ -460,21 +518,30 @@ class Settings:
         return reversed(self._context_settings)
 
 
-    def _from_context(self, param):
+    def _restore(self, keys: Iterable[str]):
+        """
+        Set the current values of parameters from the active contexts and the
+        settings, after a context has been removed.
+        """
+
+        for key in keys:
 
-        for ctx in self.contexts:
+            for ctx in self.contexts:
 
-            if param in ctx:
+                if key in ctx:
 
-                return ctx[param]
+                    self._effective[key] = ctx[key]
+                    break
 
+            else:
 
-    def _in_context(self, param):
+                if key in self._settings:
 
-        return any(
-            param in ctx
-            for ctx in self.__dict__.get('_context_settings', {})
-        )
+                    self._effective[key] = self._settings[key]
+
+                else:
+
+                    self._effective.pop(key, None)
 
 
     @contextlib.contextmanager
@@ -492,15 +559,22 @@ class Settings:
                 are the option names, values are the corresponding values.
         """
 
+        ctx = self._interned(self._dict_and_kwargs(_dict, kwargs))
+        self._context_settings.append(ctx)
+        self._effective.update(ctx)
+
         try:
 
-            ctx = self._dict_and_kwargs(_dict, kwargs)
-            self._context_settings.append(ctx)
             yield
 
         finally:
 
-            self._context_settings = self._context_settings[:-1]
+            # the contexts might have been cleared by `reset_all`
+            if self._context_settings:
+
+                self._context_settings.pop()
+
+            self._restore(ctx)
 
 
     @property
@@ -529,47 +603,31 @@ class Settings:
 
     def __getattr__(self, attr):
 
-        if attr in self:
-
-            return self[attr]
+        # one lookup in the current settings; None if the key is missing
+        return self.__dict__.get('_effective', {}).get(attr)
 
 
     def __dir__(self):
 
-        keys = object.__dir__(self)
-        [keys.extend(ctx.keys()) for ctx in self.contexts]
-        keys.extend(self._settings.keys())
-        keys = sorted(set(keys))
-
-        return keys
+        # the current settings include the keys of all active contexts
+        return sorted(set(object.__dir__(self)).union(self._effective))
 
 
     def __contains__(self, param):
 
-        return (
-            self._in_context(param) or
-            param in self.__dict__.get('_settings', {})
-        )
+        # `__dict__` because this is called by `__getattr__` also before
+        # the settings have been initialized
+        return param in self.__dict__.get('_effective', {})
 
 
     def __getitem__(self, key):
 
-        if self._in_context(key):
-
-            return self._from_context(key)
-
-        elif key in self._settings:
-
-            return self._settings[key]
-
-        else:
-
-            return None
+        return self._effective.get(key)
 
 
     def __setitem__(self, key, value):
 
-        self._settings[key] = value
+        self.setup({key: value})
 
 
     @property
@@ -579,3 +637,112 @@ class Settings:
         """
 
         return self._settings.copy()
+
+
+    @property
+    def as_mapping(self) -> MappingProxyType:
+        """
+        Read-only view of the settings of this instance, without copying.
+        """
+
+        return MappingProxyType(self._settings)
+
+
+@functools.lru_cache(maxsize = 32)
+def _read_yaml(path: str, stamp: tuple) -> Any:
+    """
+    Parse a YAML file, results are cached until the file is modified.
+    """
+
+    # libyaml decodes the bytes itself
+    with open(path, 'rb') as fp:
+
+        return _misc.yaml_load(fp)
+
+
+def _dir_contents(path: str | pl.Path) -> frozenset[str]:
+    """
+    Names of the entries in a directory, empty if it does not exist.
+
+    The listings are cached until the modification time of the directory
+    changes, i.e. until entries are added, removed or renamed.
+    """
+
+    try:
+
+        stamp = _stamp(path)
+
+    except OSError:
+
+        return frozenset()
+
+    return _listdir(os.fspath(path), stamp)
+
+
+def _stamp(path: str | pl.Path) -> tuple[int, int, int]:
+    """
+    Modification time, size and inode of a file or directory, cache keys.
+
+    With coarse file system timestamps, a change within the same tick is
+    only detected if the size or the inode changes; `Settings.reset_all`
+    empties the caches.
+    """
+
+    stat = os.stat(path)
+
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+@functools.lru_cache(maxsize = 64)
+def _listdir(path: str, stamp: tuple) -> frozenset[str]:
+
+    try:
+
+        with os.scandir(path) as entries:
+
+            return frozenset(entry.name for entry in entries)
+
+    except OSError:
+
+        return frozenset()
+
+
+@functools.lru_cache(maxsize = None)
+def _module_config_dirs(module: str) -> tuple[pl.Path]:
+    """
+    The directory of a module and its existing data directories.
+
+    These are the places to look for config files shipped with the module.
+    """
+
+    mod_path = _misc.module_path(module)
+    dirs = [mod_path]
+
+    for datadir in ('data', '_data'):
+
+        if (mod_data_path := mod_path / datadir).exists():
+
+            dirs.append(mod_data_path)
+
+    return tuple(dirs)
+
+
+@functools.lru_cache(maxsize = None)
+def _builtin_defaults(
+        datadirs: tuple[str],
+        fnames: tuple[str],
+) -> MappingProxyType:
+    """
+    Built-in defaults: the first config file found in the module data dirs.
+
+    Shared by all `Settings` instances with the same data directories, the
+    values must not be modified in place.
+    """
+
+    for datadir, fname in itertools.product(datadirs, fnames):
+
+        if os.path.exists(path := os.path.join(datadir, fname)):
+
+            return MappingProxyType(Settings.read(path) or {})
+
+    return MappingProxyType({})
@@ -27,6 +27,6 @@ data processing, module settings. Stored in YAML, JSON, TSV or other formats.
 This module also supports the access to built in data in other modules.
 """
 
-from pypath_common.data._data import load, path, builtins
+from pypath_common.data._data import load, path, builtins, clear_cache
 
-__all__ = ['builtins', 'load', 'path']
+__all__ = ['builtins', 'clear_cache', 'load', 'path']
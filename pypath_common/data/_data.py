@@ -24,25 +24,30 @@ Access built-in data in this and other modules.
 
 The files are looked up in the `data` or `_data` directory of the calling
 module by default and read by the reader function provided, or the default
-reader functions defined in `_FORMATS`.
+reader functions defined in `_FORMATS`. Gzip compressed files, e.g.
+`foo.yaml.gz`, are decompressed while reading.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import IO, Any, Callable
 import os
+import sys
+import copy
+import gzip
 import json
 import pathlib as pl
 import functools
 import collections
-
-import yaml
+import concurrent.futures
 
 import pypath_common._misc as _misc
 import pypath_common._session as _session
+import pypath_common._settings as _settings
 
 __all__ = [
     'builtins',
+    'clear_cache',
     'load',
     'path',
 ]
@@ -55,7 +60,7 @@ _FORMATS = {
         json.load,
         object_pairs_hook = collections.OrderedDict,
     ),
-    'yaml': functools.partial(yaml.load, Loader = yaml.FullLoader),
+    'yaml': _misc.yaml_load,
     'csv': 'pandas.read_csv',
     'tsv': 'pandas.read_csv',
     'xml': _misc.identity,
@@ -65,12 +70,21 @@ _FORMATS = {
     'html': _misc.identity,
     'ico': _misc.identity,
 }
+# extensions of the files listed as built-in data, including the empty one
+_DATA_EXTS = frozenset(_FORMATS)
+# the default readers of these decode the bytes themselves
+_BINARY_FORMATS = frozenset(('json', 'yaml', 'csv', 'tsv'))
+# config-like data, parsed files of these formats are cached
+_CACHED_FORMATS = frozenset(('json', 'yaml'))
 
 
 def path(label: str, module: str | None = None) -> pl.Path | None:
     """
     Find path to data shipped with a module.
 
+    Labels without directory separator and extension refer to the built-in
+    data, other labels are first checked as paths in the file system.
+
     Args:
         label:
             Label of a built-in dataset or path to a file.
@@ -81,17 +95,34 @@ def path(label: str, module: str | None = None) -> pl.Path | None:
         A path to the module data, None if not found.
     """
 
-    if os.path.exists(label):
+    label = os.fspath(label)
+    module = module or _misc.caller_module()
+    # plain names are looked up among the built-in datasets first,
+    # sparing the file system access
+    path = None if _looks_like_path(label) else _labels(module).get(label)
 
-        path = pl.Path(label).absolute()
+    if not path:
 
-    else:
+        if os.path.exists(label):
+
+            path = pl.Path(label).absolute()
+
+        else:
+
+            # labels with a different extension still resolve to the dataset
+            available = _labels(module)
+            path = available.get(label, None)
+            path = path or available.get(_misc.remove_suffix(label, '.'))
+
+    return pl.Path(path) if path else None
 
-        available = builtins(module)
-        path = available.get(label, None)
-        path = path or available.get(_misc.remove_suffix(label, '.'), None)
 
-    return path
+def _looks_like_path(label: str) -> bool:
+    """
+    Tells if a label has a directory separator or a file extension.
+    """
+
+    return os.sep in label or '/' in label or '.' in label
 
 
 def load(
@@ -114,39 +145,135 @@ def load(
             Parameters for to the reader function.
 
     Returns:
-        The object read from the file (typically a dict or list).
+        The object read from the file (typically a dict or list). JSON and
+        YAML files read by the default readers are parsed only once, until
+        modified, and a copy of the cached object is returned.
     """
 
     module = module or _misc.caller_module()
 
     if _path := path(label, module):
 
+        name = _path.name
+        opener = open
+        mode = 'rt'
+        params = None
+
+        if name[-3:].lower() == '.gz':
+
+            name = name[:-3]
+            opener = gzip.open
+
         if not reader:
 
-            ext = _path.name.rsplit('.', maxsplit = 1)[-1].lower()
-            if ext == 'tsv':
-                kwargs['sep'] = '\t'
-            reader = _FORMATS.get(ext, lambda x: x.readlines())
+            _, dot, ext = name.rpartition('.')
+            ext = ext.lower() if dot else ''
+            reader = _reader(ext)
+            mode = 'rb' if ext in _BINARY_FORMATS else 'rt'
+
+            if ext in _CACHED_FORMATS:
+
+                params = _hashable_params(kwargs)
 
-        if not callable(reader):
+        elif not callable(reader):
 
             reader = _misc.from_module(reader)
 
         _log(
-            f'Loading built-in data `{label}` from module `{module}`; '
-            f'path: `{_path}`.',
+            'Loading built-in data `%s` from module `%s`; path: `%s`.',
+            args = (label, module, _path),
         )
 
-        with open(_path) as fp:
+        if params is not None:
+
+            return copy.deepcopy(
+                _read(
+                    os.fspath(_path),
+                    _settings._stamp(_path),
+                    reader,
+                    opener,
+                    mode,
+                    params,
+                ),
+            )
+
+        with opener(_path, mode) as fp:
 
             return reader(fp, **kwargs)
 
     else:
 
-        _log(f'Could not find built-in data `{label}` in module `{module}`.')
+        _log(
+            'Could not find built-in data `%s` in module `%s`.',
+            args = (label, module),
+        )
 
 
-def builtins(module: str | None = None) -> dict[str, str]:
+@functools.lru_cache(maxsize = 32)
+def _read(
+        path: str,
+        stamp: tuple,
+        reader: Callable,
+        opener: Callable,
+        mode: str,
+        params: tuple,
+) -> Any:
+    """
+    Read a file, results are cached until the file is modified.
+    """
+
+    with opener(path, mode) as fp:
+
+        return reader(fp, **dict(params))
+
+
+def _hashable_params(kwargs: dict) -> tuple | None:
+    """
+    Reader parameters as a cache key, None if any of them is unhashable.
+    """
+
+    params = tuple(sorted(kwargs.items()))
+
+    try:
+
+        hash(params)
+
+    except TypeError:
+
+        return None
+
+    return params
+
+
+@functools.lru_cache(maxsize = None)
+def _reader(ext: str) -> Callable:
+    """
+    The default reader function for a file extension.
+
+    Readers given as strings in `_FORMATS` are imported at the first use.
+    Files of unknown format, or with no reader defined, are read as a list
+    of lines.
+    """
+
+    reader = _FORMATS.get(ext) or _readlines
+
+    if not callable(reader):
+
+        reader = _misc.from_module(reader)
+
+    if ext == 'tsv':
+
+        reader = functools.partial(reader, sep = '\t')
+
+    return reader
+
+
+def _readlines(fp: IO) -> list[str]:
+
+    return fp.readlines()
+
+
+def builtins(module: str | None = None) -> dict[str, pl.Path]:
     """
     List of built-in datasets.
 
@@ -161,13 +288,154 @@ def builtins(module: str | None = None) -> dict[str, str]:
         directory), values are the full paths.
     """
 
-    module = module or _misc.caller_module()
+    return {
+        label: pl.Path(path)
+        for label, path in _builtins(module or _misc.caller_module()).items()
+    }
+
+
+@functools.lru_cache(maxsize = None)
+def _builtins(module: str) -> dict[str, str]:
+    """
+    Built-in datasets of a module, the directory is walked only once.
+    """
+
     datadir = _misc.module_datadir(module)
 
-    return {
-        str((pl.Path(d) / pl.Path(f).stem).relative_to(datadir)):
-        pl.Path(d) / f
-        for d, dirs, files in os.walk(datadir)
-        for f in files
-        if pl.Path(f).suffix[1:].lower() in _FORMATS
+    if not datadir:
+
+        return {}
+
+    result = {}
+    subdirs = _scan_dir(datadir, '', result)
+
+    # `os.scandir` releases the GIL: larger trees are scanned in parallel
+    if len(subdirs) > 2:
+
+        workers = min(8, os.cpu_count() or 4)
+
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+
+            subtrees = list(executor.map(_scan_tree, subdirs))
+
+    else:
+
+        subtrees = map(_scan_tree, subdirs)
+
+    for subtree in subtrees:
+
+        result.update(subtree)
+
+    return result
+
+
+def _scan_tree(top: tuple[str, str]) -> dict[str, str]:
+    """
+    Data files in a directory and its subdirectories.
+
+    Args:
+        top:
+            Path to the directory and its path relative to the data
+            directory, the latter followed by a separator.
+    """
+
+    result = {}
+    stack = [top]
+
+    while stack:
+
+        stack.extend(_scan_dir(*stack.pop(), result))
+
+    return result
+
+
+def _scan_dir(
+        directory: str,
+        prefix: str,
+        result: dict[str, str],
+) -> list[tuple[str, str]]:
+    """
+    Add the data files of one directory to `result`, return its subdirectories.
+
+    Directories which can not be listed are skipped.
+    """
+
+    subdirs = []
+    files = {}
+
+    try:
+
+        with os.scandir(directory) as entries:
+
+            for entry in entries:
+
+                try:
+
+                    is_dir = entry.is_dir()
+
+                except OSError:
+
+                    is_dir = False
+
+                if is_dir:
+
+                    # like `os.walk`, symlinks to directories are not followed
+                    if not entry.is_symlink():
+
+                        subdir = f'{prefix}{entry.name}{os.sep}'
+                        subdirs.append((entry.path, subdir))
+
+                    continue
+
+                stem, _, ext = entry.name.rpartition('.')
+
+                # no extension, or a dot file
+                if not stem.strip('.'):
+
+                    stem, ext = entry.name, ''
+
+                # compressed data, e.g. `foo.yaml.gz`
+                elif ext.lower() == 'gz' and '.' in stem.lstrip('.'):
+
+                    stem, _, ext = stem.rpartition('.')
+
+                if ext in _DATA_EXTS or ext.lower() in _DATA_EXTS:
+
+                    # the compiler interns literals like `'aacodes'`, lookups
+                    # by those match interned keys by identity
+                    files[sys.intern(f'{prefix}{stem}')] = entry.path
+
+    except OSError:
+
+        # like `os.walk`, unreadable or vanished directories are skipped
+        return []
+
+    result.update(files)
+
+    return subdirs
+
+
+@functools.lru_cache(maxsize = None)
+def _labels(module: str) -> dict[str, str]:
+    """
+    Built-in datasets of a module by label, with or without file extension.
+    """
+
+    stems = _builtins(module)
+    labels = {
+        os.path.join(os.path.dirname(label), os.path.basename(path)): path
+        for label, path in stems.items()
     }
+    labels.update(stems)
+
+    return labels
+
+
+def clear_cache() -> None:
+    """
+    Forget the lists of built-in datasets and the contents of the files read.
+    """
+
+    _builtins.cache_clear()
+    _labels.cache_clear()
+    _read.cache_clear()
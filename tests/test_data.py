@@ -0,0 +1,112 @@
+import os
+import gzip
+
+from pypath_common import data, _misc
+from pypath_common.data import _data
+
+__all__ = ['TestData']
+
+
+class TestData:
+    def test_load_yaml(self):
+
+        amino_acids = data.load('amino_acids', module = 'pypath_common')
+
+        assert isinstance(amino_acids, tuple)
+        assert amino_acids[0] == ('alanine', 'Ala', 'A')
+
+    def test_path(self):
+
+        path = data.path('aacodes', module = 'pypath_common')
+
+        assert path.name == 'aacodes.yaml'
+        assert data.path('aacodes.yaml', module = 'pypath_common') == path
+
+    def test_common_data(self):
+
+        assert _misc.aacodes()['A'] == 'ALA'
+        assert _misc.aminoa_3_to_1_letter()['Ala'] == 'A'
+        assert _misc.aacodes() is _misc.aacodes()
+        assert isinstance(_misc.psite_mod_types(), tuple)
+        assert all(
+            isinstance(v, tuple) for v in _misc.mod_keywords().values()
+        )
+
+    def test_builtins(self):
+
+        builtins = data.builtins(module = 'pypath_common')
+        builtins.clear()
+        data.clear_cache()
+
+        assert 'aacodes' in data.builtins(module = 'pypath_common')
+
+    def test_load_cached(self):
+
+        settings = data.load('settings', module = 'pypath_common')
+        settings['foo'] = 'bar'
+
+        assert 'foo' not in data.load('settings', module = 'pypath_common')
+
+    def test_load_gzip(self, tmp_path):
+
+        path = tmp_path / 'foo.yaml.gz'
+
+        with gzip.open(path, 'wt') as fp:
+
+            fp.write('foo: bar\n')
+
+        assert data.load(str(path)) == {'foo': 'bar'}
+
+    def test_path_namespace_package(self, tmp_path, monkeypatch):
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        (tmp_path / 'nspkg').mkdir()
+        (tmp_path / 'myfile').write_text('foo\n')
+
+        assert data.path('myfile', module = 'nspkg') == tmp_path / 'myfile'
+
+    def test_load_not_cached(self, tmp_path):
+
+        path = tmp_path / 'foo.txt'
+        path.write_text('foo\n')
+        data.clear_cache()
+
+        assert data.load(str(path)) == ['foo\n']
+        assert _data._read.cache_info().currsize == 0
+
+    def test_builtins_unreadable_dir(self, tmp_path, monkeypatch):
+
+        datadir = tmp_path / 'datamod' / 'data'
+        (datadir / 'locked').mkdir(parents = True)
+        (datadir.parent / '__init__.py').write_text('')
+        (datadir / 'foo.yaml').write_text('foo: 1\n')
+        (datadir / 'locked' / 'bar.yaml').write_text('bar: 1\n')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        scandir = os.scandir
+
+        def _scandir(path):
+
+            if str(path).endswith('locked'):
+
+                raise PermissionError(path)
+
+            return scandir(path)
+
+        monkeypatch.setattr(os, 'scandir', _scandir)
+
+        assert list(data.builtins(module = 'datamod')) == ['foo']
+
+    def test_load_modified(self, tmp_path):
+
+        path = tmp_path / 'foo.yaml'
+        path.write_text('foo: 1\n')
+
+        assert data.load(str(path)) == {'foo': 1}
+
+        mtime = path.stat().st_mtime_ns
+        path.write_text('foo: 22\n')
+        # as if written within the same clock tick
+        os.utime(path, ns = (mtime, mtime))
+
+        assert data.load(str(path)) == {'foo': 22}
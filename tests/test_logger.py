@@ -0,0 +1,83 @@
+from pypath_common import _logger, _session, _settings
+
+__all__ = ['TestLogger']
+
+
+class TestLogger:
+    def _logger(self, tmp_path):
+
+        return _logger.Logger(
+            fname = 'test.log',
+            settings = _settings.Settings(),
+            verbosity = 0,
+            console_level = -1,
+            logdir = str(tmp_path),
+        )
+
+    def _read(self, logger):
+
+        logger.close_logfile()
+
+        with open(logger.fname) as fp:
+
+            return fp.read()
+
+    def test_lazy_formatting(self, tmp_path):
+
+        logger = self._logger(tmp_path)
+        logger.msg('Loaded %s.', args = ('foo',))
+        # dropped by the level, hence never formatted
+        logger.msg('%d', level = 1, args = ('bar',))
+        logger.msg('Positional %s label', 'mylabel', 0)
+
+        content = self._read(logger)
+
+        assert 'Loaded foo.' in content
+        assert '[mylabel] Positional %s label' in content
+
+    def test_enabled(self, tmp_path):
+
+        logger = self._logger(tmp_path)
+
+        assert logger.enabled()
+        assert not logger.enabled(1)
+
+        logger.close_logfile()
+
+    def test_traceback(self):
+
+        class Recorder(_session.Logger):
+
+            def __init__(self):
+
+                super().__init__(name = 'recorder', module = 'pypath_common')
+                self.lines = []
+
+            def _log(self, msg = '', level = 0, *, args = ()):
+
+                self.lines.append(msg)
+
+        recorder = Recorder()
+
+        try:
+
+            raise ValueError('boom')
+
+        except ValueError:
+
+            recorder._log_traceback()
+
+        assert recorder.lines[0] == 'Traceback (most recent call last):'
+        assert any('test_traceback' in line for line in recorder.lines)
+        assert recorder.lines[-1] == 'ValueError: boom'
+
+    def test_session_finished_once(self, tmp_path, monkeypatch):
+
+        monkeypatch.chdir(tmp_path)
+        session = _session.Session(module = 'pypath_common', label = 'once')
+        session.finish_logger()
+        session.__del__()
+
+        with open(session._logger.fname) as fp:
+
+            assert fp.read().count('Session `once` finished.') == 1
@@ -0,0 +1,21 @@
+import importlib
+
+from pypath_common import _misc
+
+__all__ = ['TestMisc']
+
+
+class TestMisc:
+    def test_caller_module_top(self, tmp_path, monkeypatch):
+
+        (tmp_path / 'callerpkg').mkdir()
+        (tmp_path / 'callerpkg' / '__init__.py').write_text('')
+        (tmp_path / 'callerpkg' / 'sub.py').write_text(
+            'from pypath_common import _misc\n'
+            'def caller():\n'
+            '    return _misc.caller_module()\n',
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        sub = importlib.import_module('callerpkg.sub')
+
+        assert sub.caller() == 'callerpkg'
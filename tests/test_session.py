@@ -0,0 +1,20 @@
+import weakref
+
+from pypath_common import _session
+
+__all__ = ['TestSession']
+
+
+class TestSession:
+    def test_session_module_name(self, monkeypatch):
+
+        sess = _session.session('pypath')
+        monkeypatch.setitem(_session.SESSIONS, 'pypath_common', object())
+
+        assert _session.session('pypath_common') is sess
+
+    def test_session_weakref(self):
+
+        sess = _session.session('pypath')
+
+        assert weakref.ref(sess)() is sess
@@ -0,0 +1,108 @@
+import os
+
+from pypath_common import _settings
+
+__all__ = ['TestSettings']
+
+
+class TestSettings:
+    def test_context(self):
+
+        settings = _settings.Settings(foo = 1, bar = 2)
+
+        with settings.context(foo = 3):
+
+            assert settings.foo == 3
+            assert settings.bar == 2
+
+            with settings.context(foo = 4, baz = 5):
+
+                assert settings.get('foo') == 4
+                assert 'baz' in settings
+
+            assert settings['foo'] == 3
+            assert 'baz' not in settings
+            assert settings.baz is None
+
+        assert settings.foo == 1
+
+    def test_setup_in_context(self):
+
+        settings = _settings.Settings(foo = 1)
+
+        with settings.context(foo = 2):
+
+            settings.setup(foo = 3, bar = 4)
+
+            assert settings.foo == 2
+            assert settings.bar == 4
+
+        assert settings.foo == 3
+        assert settings.bar == 4
+
+    def test_setup_keeps_dict(self):
+
+        settings = _settings.Settings()
+        param = {'foo': 1}
+        settings.setup(param, bar = 2)
+
+        assert param == {'foo': 1}
+        assert settings.foo == 1
+        assert settings.bar == 2
+
+    def test_config_in_wd(self, tmp_path, monkeypatch):
+
+        monkeypatch.chdir(tmp_path)
+        settings = _settings.Settings()
+
+        assert settings.paths_in(user = False, old_user = False) == []
+
+        (tmp_path / 'settings.yaml').write_text('foo: 1\n')
+        settings.reset_all()
+
+        assert settings.foo == 1
+
+    def test_duplicate_config_dir(self, tmp_path, monkeypatch):
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'settings.yaml').write_text('log_verbosity: 5\n')
+        settings = _settings.Settings(
+            module = 'pypath_common',
+            paths = ['pypath_common'],
+        )
+
+        assert settings.log_verbosity == 5
+
+    def test_reset_all_rereads(self, tmp_path, monkeypatch):
+
+        monkeypatch.chdir(tmp_path)
+        path = tmp_path / 'settings.yaml'
+        path.write_text('foo: 1\n')
+        mtime = path.stat().st_mtime_ns
+        settings = _settings.Settings()
+
+        # same size and timestamp, as with a change in the same clock tick
+        path.write_text('foo: 2\n')
+        os.utime(path, ns = (mtime, mtime))
+        settings.reset_all()
+
+        assert settings.foo == 2
+
+    def test_builtin_defaults(self, tmp_path, monkeypatch):
+
+        (tmp_path / 'defmod' / 'data').mkdir(parents = True)
+        (tmp_path / 'defmod' / '__init__.py').write_text('')
+        path = tmp_path / 'defmod' / 'data' / 'settings.yaml'
+        path.write_text('foo:\n- 1\n')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        settings = _settings.Settings(module = 'defmod')
+        settings.builtin_default('foo').append(2)
+        other = _settings.Settings(module = 'defmod')
+
+        assert other.builtin_default('foo') == [1]
+
+        path.write_text('foo:\n- 3\n')
+        settings.reset_all()
+
+        assert settings.builtin_default('foo') == [3]